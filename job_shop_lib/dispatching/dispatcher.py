@@ -337,31 +337,38 @@ class Dispatcher:
             A list of Operation objects that are available for scheduling
             based on precedence and machine constraints only.
         """
-        available_operations = []
-        for job_id, next_position in enumerate(self._job_next_operation_index):
-            if next_position == len(self.instance.jobs[job_id]):
-                continue
-            operation = self.instance.jobs[job_id][next_position]
-            available_operations.append(operation)
-        return available_operations
+        jobs = self.instance.jobs
+        return [
+            jobs[job_id][next_position]
+            for job_id, next_position in enumerate(
+                self._job_next_operation_index
+            )
+            if next_position < len(jobs[job_id])
+        ]
 
     @_dispatcher_cache
     def unscheduled_operations(self) -> list[Operation]:
         """Returns the list of operations that have not been scheduled."""
-        unscheduled_operations = []
-        for job_id, next_position in enumerate(self._job_next_operation_index):
-            operations = self.instance.jobs[job_id][next_position:]
-            unscheduled_operations.extend(operations)
-        return unscheduled_operations
+        jobs = self.instance.jobs
+        return [
+            operation
+            for job_id, next_position in enumerate(
+                self._job_next_operation_index
+            )
+            for operation in jobs[job_id][next_position:]
+        ]
 
     @_dispatcher_cache
     def scheduled_operations(self) -> list[Operation]:
         """Returns the list of operations that have been scheduled."""
-        scheduled_operations = []
-        for job_id, next_position in enumerate(self._job_next_operation_index):
-            operations = self.instance.jobs[job_id][:next_position]
-            scheduled_operations.extend(operations)
-        return scheduled_operations
+        jobs = self.instance.jobs
+        return [
+            operation
+            for job_id, next_position in enumerate(
+                self._job_next_operation_index
+            )
+            for operation in jobs[job_id][:next_position]
+        ]
 
     @_dispatcher_cache
     def available_machines(self) -> list[int]:
@@ -456,7 +463,9 @@ class Dispatcher:
         only returned unscheduled operations. For the old behavior, use the
         `unscheduled_operations` method.
         """
-        uncompleted_operations = self.unscheduled_operations()
+        # Copied so that the cached result of `unscheduled_operations` is not
+        # modified.
+        uncompleted_operations = self.unscheduled_operations().copy()
         uncompleted_operations.extend(
             scheduled_operation.operation
             for scheduled_operation in self.ongoing_operations()
@@ -472,7 +481,12 @@ class Dispatcher:
         """
         current_time = self.current_time()
         ongoing_operations = []
-        for machine_schedule in self.schedule.schedule:
+        for machine_id, machine_schedule in enumerate(self.schedule.schedule):
+            # The next available time of a machine is the end time of its
+            # last scheduled operation, so idle machines can be skipped
+            # without reading their schedules.
+            if self._machine_next_available_time[machine_id] <= current_time:
+                continue
             for scheduled_operation in reversed(machine_schedule):
                 is_completed = scheduled_operation.end_time <= current_time
                 if is_completed:
@@ -24,6 +24,12 @@ class CompositeFeatureObserver(FeatureObserver):
             corresponding feature matrix. Column names are generated based on
             the class name of the `FeatureObserver` instance that produced the
             feature.
+        reuse_buffers:
+            Whether to write the aggregated features of each update into the
+            arrays of the previous one instead of allocating new ones. This
+            avoids an allocation per feature type and update, but the arrays
+            returned before an update are overwritten by it, so they must be
+            copied to be kept. Defaults to False.
     """
 
     def __init__(
@@ -31,6 +37,7 @@ class CompositeFeatureObserver(FeatureObserver):
         dispatcher: Dispatcher,
         feature_observers: list[FeatureObserver] | None = None,
         subscribe: bool = True,
+        reuse_buffers: bool = False,
     ):
         if feature_observers is None:
             feature_observers = [
@@ -39,6 +46,7 @@ class CompositeFeatureObserver(FeatureObserver):
                 if isinstance(observer, FeatureObserver)
             ]
         self.feature_observers = feature_observers
+        self.reuse_buffers = reuse_buffers
         self.column_names: dict[FeatureType, list[str]] = defaultdict(list)
         super().__init__(dispatcher, subscribe=subscribe)
         self._set_column_names()
@@ -60,10 +68,30 @@ class CompositeFeatureObserver(FeatureObserver):
                 features[feature_type].append(feature_matrix)
 
         self.features = {
-            feature_type: np.concatenate(features, axis=1)
-            for feature_type, features in features.items()
+            feature_type: self._concatenate(feature_type, feature_matrices)
+            for feature_type, feature_matrices in features.items()
         }
 
+    def _concatenate(
+        self, feature_type: FeatureType, feature_matrices: list[np.ndarray]
+    ) -> np.ndarray:
+        """Concatenates the feature matrices.
+
+        If `reuse_buffers` is True, the result is written into the matrix of
+        the previous update when its shape and dtype still match.
+        """
+        if not self.reuse_buffers:
+            return np.concatenate(feature_matrices, axis=1)
+        shape = (
+            feature_matrices[0].shape[0],
+            sum(matrix.shape[1] for matrix in feature_matrices),
+        )
+        dtype = np.result_type(*feature_matrices)
+        out = self.features.get(feature_type)
+        if out is None or out.shape != shape or out.dtype != dtype:
+            out = np.empty(shape, dtype=dtype)
+        return np.concatenate(feature_matrices, axis=1, out=out)
+
     def _set_column_names(self):
         for observer in self.feature_observers:
             for feature_type, feature_matrix in observer.features.items():
@@ -33,36 +33,39 @@ class DurationObserver(FeatureObserver):
         feature_types: list[FeatureType] | FeatureType | None = None,
         subscribe: bool = True,
     ):
-        super().__init__(
-            dispatcher, feature_types, feature_size=1, subscribe=subscribe
-        )
-
-    def initialize_features(self):
-        mapping = {
+        # Built once instead of on every call to `initialize_features` and
+        # `update`.
+        self._initializers = {
             FeatureType.OPERATIONS: self._initialize_operation_durations,
             FeatureType.MACHINES: self._initialize_machine_durations,
             FeatureType.JOBS: self._initialize_job_durations,
         }
-        for feature_type in self.features:
-            mapping[feature_type]()
-
-    def update(self, scheduled_operation: ScheduledOperation):
-        mapping = {
+        self._updaters = {
             FeatureType.OPERATIONS: self._update_operation_durations,
             FeatureType.MACHINES: self._update_machine_durations,
             FeatureType.JOBS: self._update_job_durations,
         }
+        super().__init__(
+            dispatcher, feature_types, feature_size=1, subscribe=subscribe
+        )
+
+    def initialize_features(self):
+        for feature_type in self.features:
+            self._initializers[feature_type]()
+
+    def update(self, scheduled_operation: ScheduledOperation):
         for feature_type in self.features:
-            mapping[feature_type](scheduled_operation)
+            self._updaters[feature_type](scheduled_operation)
 
     def _initialize_operation_durations(self):
         duration_matrix = self.dispatcher.instance.durations_matrix_array
-        operation_durations = np.array(duration_matrix).reshape(-1, 1)
-        # Drop the NaN values
-        operation_durations = operation_durations[
-            ~np.isnan(operation_durations)
-        ].reshape(-1, 1)
-        self.features[FeatureType.OPERATIONS] = operation_durations
+        # Drop the NaN values. Indexing the cached matrix with the mask
+        # directly avoids copying it first, and writing into the existing
+        # feature matrix keeps its dtype and avoids a new allocation.
+        is_operation = ~np.isnan(duration_matrix)
+        self.features[FeatureType.OPERATIONS][:, 0] = duration_matrix[
+            is_operation
+        ]
 
     def _initialize_machine_durations(self):
         machine_durations = self.dispatcher.instance.machine_loads
@@ -24,14 +24,26 @@ class EarliestStartTimeObserver(FeatureObserver):
         # Earliest start times initialization
         # -------------------------------
         squared_duration_matrix = dispatcher.instance.durations_matrix_array
+        # Kept as float32 (the dtype of the feature matrices) so that copying
+        # the start times into the features does not require a conversion.
         self.earliest_start_times = np.hstack(
             (
-                np.zeros((squared_duration_matrix.shape[0], 1)),
+                np.zeros(
+                    (squared_duration_matrix.shape[0], 1), dtype=np.float32
+                ),
                 np.cumsum(squared_duration_matrix[:, :-1], axis=1),
             )
         )
         self.earliest_start_times[np.isnan(squared_duration_matrix)] = np.nan
+        # Computed once: selects the entries of `earliest_start_times` that
+        # correspond to actual operations, in `operation_id` order.
+        self._is_operation = ~np.isnan(squared_duration_matrix)
         # -------------------------------
+        self._feature_updaters = {
+            FeatureType.OPERATIONS: self._update_operation_features,
+            FeatureType.MACHINES: self._update_machine_features,
+            FeatureType.JOBS: self._update_job_features,
+        }
         super().__init__(
             dispatcher, feature_types, feature_size=1, subscribe=subscribe
         )
@@ -86,26 +98,15 @@ class EarliestStartTimeObserver(FeatureObserver):
     def initialize_features(self):
         """Initializes the features based on the current state of the
         dispatcher."""
-        mapping = {
-            FeatureType.OPERATIONS: self._update_operation_features,
-            FeatureType.MACHINES: self._update_machine_features,
-            FeatureType.JOBS: self._update_job_features,
-        }
         for feature_type in self.features:
-            mapping[feature_type]()
+            self._feature_updaters[feature_type]()
 
     def _update_operation_features(self):
         """Ravels the 2D array into a 1D array"""
         current_time = self.dispatcher.current_time()
-        next_index = 0
-        for job_id, operations in enumerate(self.dispatcher.instance.jobs):
-            self.features[FeatureType.OPERATIONS][
-                next_index : next_index + len(operations), 0
-            ] = (
-                self.earliest_start_times[job_id, : len(operations)]
-                - current_time
-            )
-            next_index += len(operations)
+        self.features[FeatureType.OPERATIONS][:, 0] = (
+            self.earliest_start_times[self._is_operation] - current_time
+        )
 
     def _update_machine_features(self):
         """Picks the minimum start time of all operations that can be scheduled
@@ -29,20 +29,23 @@ class IsCompletedObserver(FeatureObserver):
         self.remaining_ops_per_job = np.zeros(
             (dispatcher.instance.num_jobs, 1), dtype=int
         )
+        # Scheduled operations that have not been marked as completed yet.
+        # Only these need to be checked after each dispatch, instead of
+        # recomputing the whole set of completed operations.
+        self._pending_operations: list[ScheduledOperation] = []
         super().__init__(dispatcher, feature_types, feature_size=1)
 
     def initialize_features(self):
+        self._pending_operations = [
+            scheduled_operation
+            for machine_schedule in self.dispatcher.schedule.schedule
+            for scheduled_operation in machine_schedule
+        ]
         self._initialize_remaining_operations()
 
     def update(self, scheduled_operation: ScheduledOperation):
         if FeatureType.OPERATIONS in self.features:
-            # operation_id = scheduled_operation.operation.operation_id
-            # self.features[FeatureType.OPERATIONS][operation_id, 0] = 1
-            completed_operations = [
-                op.operation_id
-                for op in self.dispatcher.completed_operations()
-            ]
-            self.features[FeatureType.OPERATIONS][completed_operations, 0] = 1
+            self._update_completed_operations(scheduled_operation)
         if FeatureType.MACHINES in self.features:
             machine_id = scheduled_operation.machine_id
             self.remaining_ops_per_machine[machine_id, 0] -= 1
@@ -54,6 +57,21 @@ class IsCompletedObserver(FeatureObserver):
             is_completed = self.remaining_ops_per_job[job_id, 0] == 0
             self.features[FeatureType.JOBS][job_id, 0] = is_completed
 
+    def _update_completed_operations(
+        self, scheduled_operation: ScheduledOperation
+    ):
+        self._pending_operations.append(scheduled_operation)
+        current_time = self.dispatcher.current_time()
+        operation_features = self.features[FeatureType.OPERATIONS]
+        still_pending = []
+        for pending_operation in self._pending_operations:
+            if pending_operation.end_time <= current_time:
+                operation_id = pending_operation.operation.operation_id
+                operation_features[operation_id, 0] = 1
+            else:
+                still_pending.append(pending_operation)
+        self._pending_operations = still_pending
+
     def _initialize_remaining_operations(self):
         remaining_ops_observer = self._get_remaining_operations_observer(
             self.dispatcher, self.features
@@ -77,10 +95,12 @@ class IsCompletedObserver(FeatureObserver):
         # instead of uncompleted_operations, because in this case
         # they will output the same operations, and the former is slightly
         # more efficient.
+        has_job_features = FeatureType.JOBS in self.features
+        has_machine_features = FeatureType.MACHINES in self.features
         for operation in self.dispatcher.unscheduled_operations():
-            if FeatureType.JOBS in self.features:
+            if has_job_features:
                 self.remaining_ops_per_job[operation.job_id, 0] += 1
-            if FeatureType.MACHINES in self.features:
+            if has_machine_features:
                 self.remaining_ops_per_machine[operation.machine_id, 0] += 1
 
     def _get_remaining_operations_observer(
@@ -1,5 +1,7 @@
 """Home of the `IsReadyObserver` class."""
 
+import numpy as np
+
 from job_shop_lib.dispatching import Dispatcher
 from job_shop_lib.dispatching.feature_observers import (
     FeatureObserver,
@@ -17,6 +19,11 @@ class IsReadyObserver(FeatureObserver):
         feature_types: list[FeatureType] | FeatureType | None = None,
         subscribe: bool = True,
     ):
+        self._ready_nodes_getters = {
+            FeatureType.OPERATIONS: self._get_ready_operation_nodes,
+            FeatureType.MACHINES: self._get_ready_machine_nodes,
+            FeatureType.JOBS: self._get_ready_job_nodes,
+        }
         super().__init__(
             dispatcher, feature_types, feature_size=1, subscribe=subscribe
         )
@@ -24,17 +31,19 @@ class IsReadyObserver(FeatureObserver):
     def initialize_features(self):
         self.set_features_to_zero()
         for feature_type, feature in self.features.items():
-            node_ids = self._get_ready_nodes(feature_type)
+            node_ids = self._ready_nodes_getters[feature_type]()
             feature[node_ids, 0] = 1.0
 
-    def _get_ready_nodes(self, feature_type: FeatureType) -> list[int]:
-        mapping = {
-            FeatureType.OPERATIONS: self._get_ready_operation_nodes,
-            FeatureType.MACHINES: self.dispatcher.available_machines,
-            FeatureType.JOBS: self.dispatcher.available_jobs,
-        }
-        return mapping[feature_type]()
-
-    def _get_ready_operation_nodes(self) -> list[int]:
+    def _get_ready_operation_nodes(self) -> np.ndarray:
         available_operations = self.dispatcher.available_operations()
-        return [operation.operation_id for operation in available_operations]
+        return np.fromiter(
+            (operation.operation_id for operation in available_operations),
+            dtype=np.intp,
+            count=len(available_operations),
+        )
+
+    def _get_ready_machine_nodes(self) -> list[int]:
+        return self.dispatcher.available_machines()
+
+    def _get_ready_job_nodes(self) -> list[int]:
+        return self.dispatcher.available_jobs()
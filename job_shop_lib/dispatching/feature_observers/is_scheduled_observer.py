@@ -26,9 +26,10 @@ class IsScheduledObserver(FeatureObserver):
 
         ongoing_operations = self.dispatcher.ongoing_operations()
         self.set_features_to_zero(exclude=FeatureType.OPERATIONS)
+        machine_features = self.features.get(FeatureType.MACHINES)
+        job_features = self.features.get(FeatureType.JOBS)
         for scheduled_op in ongoing_operations:
-            if FeatureType.MACHINES in self.features:
-                machine_id = scheduled_op.machine_id
-                self.features[FeatureType.MACHINES][machine_id, 0] += 1.0
-            if FeatureType.JOBS in self.features:
-                self.features[FeatureType.JOBS][scheduled_op.job_id, 0] += 1.0
+            if machine_features is not None:
+                machine_features[scheduled_op.machine_id, 0] += 1.0
+            if job_features is not None:
+                job_features[scheduled_op.job_id, 0] += 1.0
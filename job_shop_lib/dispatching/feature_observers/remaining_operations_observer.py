@@ -37,13 +37,13 @@ class RemainingOperationsObserver(FeatureObserver):
         )
 
     def initialize_features(self):
+        job_features = self.features.get(FeatureType.JOBS)
+        machine_features = self.features.get(FeatureType.MACHINES)
         for operation in self.dispatcher.unscheduled_operations():
-            if FeatureType.JOBS in self.features:
-                self.features[FeatureType.JOBS][operation.job_id, 0] += 1
-            if FeatureType.MACHINES in self.features:
-                self.features[FeatureType.MACHINES][
-                    operation.machine_id, 0
-                ] += 1
+            if job_features is not None:
+                job_features[operation.job_id, 0] += 1
+            if machine_features is not None:
+                machine_features[operation.machine_id, 0] += 1
 
     def update(self, scheduled_operation: ScheduledOperation):
         if FeatureType.JOBS in self.features:
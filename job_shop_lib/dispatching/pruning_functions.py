@@ -52,15 +52,19 @@ def prune_dominated_operations(
     it starts on the same machine.
     """
 
-    min_machine_end_times = _get_min_machine_end_times(dispatcher, operations)
+    start_times = _get_start_times(dispatcher, operations)
+    min_machine_end_times = _get_min_machine_end_times(
+        dispatcher, operations, start_times
+    )
 
     non_dominated_operations: list[Operation] = []
-    for operation in operations:
+    for operation, operation_start_times in zip(operations, start_times):
         # One benchmark instance has an operation with duration 0
         if operation.duration == 0:
             return [operation]
-        for machine_id in operation.machines:
-            start_time = dispatcher.start_time(operation, machine_id)
+        for machine_id, start_time in zip(
+            operation.machines, operation_start_times
+        ):
             is_dominated = start_time >= min_machine_end_times[machine_id]
             if not is_dominated:
                 non_dominated_operations.append(operation)
@@ -87,13 +91,27 @@ def prune_non_immediate_machines(
     return non_dominated_operations
 
 
-def _get_min_machine_end_times(
+def _get_start_times(
     dispatcher: Dispatcher, available_operations: list[Operation]
+) -> list[list[int]]:
+    """Returns the start time of each operation in each of its machines.
+
+    The start times are computed once and shared by the helpers below,
+    instead of calling `Dispatcher.start_time` in every pass."""
+    return [
+        [dispatcher.start_time(op, machine_id) for machine_id in op.machines]
+        for op in available_operations
+    ]
+
+
+def _get_min_machine_end_times(
+    dispatcher: Dispatcher,
+    available_operations: list[Operation],
+    start_times: list[list[int]],
 ) -> list[int | float]:
     end_times_per_machine = [float("inf")] * dispatcher.instance.num_machines
-    for op in available_operations:
-        for machine_id in op.machines:
-            start_time = dispatcher.start_time(op, machine_id)
+    for op, op_start_times in zip(available_operations, start_times):
+        for machine_id, start_time in zip(op.machines, op_start_times):
             end_times_per_machine[machine_id] = min(
                 end_times_per_machine[machine_id], start_time + op.duration
             )
@@ -106,11 +124,14 @@ def _get_immediate_machines(
     """Returns the machine ids of the machines that have at least one
     operation with the lowest start time (i.e. the start time)."""
     working_machines = [False] * self.instance.num_machines
+    if not available_operations:
+        return working_machines
+    start_times = _get_start_times(self, available_operations)
     # We can't use the current_time directly because it will cause
     # an infinite loop.
-    current_time = self.min_start_time(available_operations)
-    for op in available_operations:
-        for machine_id in op.machines:
-            if self.start_time(op, machine_id) == current_time:
+    current_time = min(min(op_start_times) for op_start_times in start_times)
+    for op, op_start_times in zip(available_operations, start_times):
+        for machine_id, start_time in zip(op.machines, op_start_times):
+            if start_time == current_time:
                 working_machines[machine_id] = True
     return working_machines
@@ -1,8 +1,8 @@
 """Classes for generating transformed JobShopInstance objects."""
 
 import abc
-import copy
 import random
+from collections.abc import Iterable
 
 from job_shop_lib import JobShopInstance, Operation
 
@@ -139,11 +139,12 @@ class RemoveJobs(Transformation):
             target_jobs = random.randint(self.min_jobs, self.max_jobs)
         else:
             target_jobs = self.target_jobs
-        new_jobs = copy.deepcopy(instance.jobs)
+        job_indices = list(range(instance.num_jobs))
 
-        while len(new_jobs) > target_jobs:
-            new_jobs.pop(random.randint(0, len(new_jobs) - 1))
+        while len(job_indices) > target_jobs:
+            job_indices.pop(random.randint(0, len(job_indices) - 1))
 
+        new_jobs = _copy_jobs(instance.jobs[i] for i in job_indices)
         return JobShopInstance(new_jobs, instance.name)
 
     @staticmethod
@@ -159,6 +160,21 @@ class RemoveJobs(Transformation):
         Returns:
             A new JobShopInstance with the specified job removed.
         """
-        new_jobs = copy.deepcopy(instance.jobs)
-        new_jobs.pop(job_index)
-        return JobShopInstance(new_jobs, instance.name)
+        jobs = list(instance.jobs)
+        jobs.pop(job_index)
+        return JobShopInstance(_copy_jobs(jobs), instance.name)
+
+
+def _copy_jobs(jobs: Iterable[list[Operation]]) -> list[list[Operation]]:
+    """Returns new operations with the same machines and durations.
+
+    It is used instead of `copy.deepcopy` because the job id, position and
+    operation id are reassigned by the new `JobShopInstance` anyway.
+    """
+    return [
+        [
+            Operation(list(operation.machines), operation.duration)
+            for operation in job
+        ]
+        for job in jobs
+    ]
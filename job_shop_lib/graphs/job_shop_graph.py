@@ -180,10 +180,23 @@ class JobShopGraph:
         Args:
             node_id: The id of the node to remove.
         """
+        # Only the neighbors of the removed node can become isolated, so we
+        # avoid scanning the whole graph for isolated nodes.
+        neighbors = set(self.graph.predecessors(node_id))
+        neighbors.update(self.graph.successors(node_id))
+        neighbors.discard(node_id)
+
         self.graph.remove_node(node_id)
         self.removed_nodes[node_id] = True
 
-        isolated_nodes = list(nx.isolates(self.graph))
+        isolated_nodes = [
+            neighbor
+            for neighbor in neighbors
+            if self.graph.degree(neighbor) == 0
+        ]
+        if not isolated_nodes:
+            return
+
         for isolated_node in isolated_nodes:
             self.removed_nodes[isolated_node] = True
 
@@ -67,14 +67,18 @@ def plot_agent_task_graph(
     node_colors = [
         _get_node_color(node, machine_colors) for node in job_shop_graph.nodes
     ]
-    node_shapes = {"machine": "s", "job": "d", "operation": "o", "global": "o"}
+    node_shapes = {
+        NodeType.MACHINE: "s",
+        NodeType.JOB: "d",
+        NodeType.OPERATION: "o",
+        NodeType.GLOBAL: "o",
+    }
 
     # Draw nodes with different shapes based on their type
     for node_type, shape in node_shapes.items():
         current_nodes = [
             node.node_id
-            for node in job_shop_graph.nodes
-            if node.node_type.name.lower() == node_type
+            for node in job_shop_graph.nodes_by_type.get(node_type, [])
         ]
         nx.draw_networkx_nodes(
             graph,
@@ -1,10 +1,10 @@
 """Module for creating a GIF of the schedule being built by a
 dispatching rule solver."""
 
+import io
 import os
 import pathlib
-import shutil
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 
 import imageio
 import matplotlib.pyplot as plt
@@ -52,15 +52,27 @@ def create_gif(
         fps:
             The number of frames per second in the GIF.
         remove_frames:
-            Whether to remove the frames after creating the GIF.
+            Whether to remove the frames after creating the GIF. If True, the
+            frames are kept in memory and never written to disk.
         frames_dir:
-            The directory to save the frames in. If not provided,
-            `gif_path.replace(".gif", "") + "_frames"` is used.
+            The directory to save the frames in if `remove_frames` is False.
+            If not provided, `gif_path.replace(".gif", "") + "_frames"` is
+            used.
         plot_current_time:
             Whether to plot a vertical line at the current time.
     """
     if plot_function is None:
-        plot_function = plot_gantt_chart_wrapper()
+        plot_function = plot_gantt_chart_wrapper(reuse_figure=True)
+
+    if remove_frames:
+        images = [
+            _figure_to_image(figure)
+            for figure in _plot_gantt_chart_frames(
+                instance, solver, plot_function, plot_current_time
+            )
+        ]
+        imageio.mimsave(gif_path, images, fps=fps, loop=0)
+        return
 
     if frames_dir is None:
         # Use the name of the GIF file as the directory name
@@ -73,14 +85,12 @@ def create_gif(
     )
     create_gif_from_frames(frames_dir, gif_path, fps)
 
-    if remove_frames:
-        shutil.rmtree(frames_dir)
-
 
 def plot_gantt_chart_wrapper(
     title: str | None = None,
     cmap: str = "viridis",
     show_available_operations: bool = False,
+    reuse_figure: bool = False,
 ) -> Callable[[Schedule, int, list[Operation] | None, int | None], Figure]:
     """Returns a function that plots a Gantt chart for an unfinished schedule.
 
@@ -89,6 +99,10 @@ def plot_gantt_chart_wrapper(
         cmap: The name of the colormap to use.
         show_available_operations:
             Whether to show the available operations in the Gantt chart.
+        reuse_figure:
+            Whether to clear and redraw the same figure on every call instead
+            of creating a new one. This makes creating many frames faster, but
+            each call overwrites the figure returned by the previous one.
 
     Returns:
         A function that plots a Gantt chart for a schedule. The function takes
@@ -100,6 +114,7 @@ def plot_gantt_chart_wrapper(
         - current_time: The current time in the schedule. If provided, a
             red vertical line is plotted at this time.
     """
+    reused_axes: list[plt.Axes] = []
 
     def plot_function(
         schedule: Schedule,
@@ -107,8 +122,9 @@ def plot_gantt_chart_wrapper(
         available_operations: list | None = None,
         current_time: int | None = None,
     ) -> Figure:
+        ax = _get_cleared_axes(reused_axes) if reuse_figure else None
         fig, ax = plot_gantt_chart(
-            schedule, title=title, cmap_name=cmap, xlim=makespan
+            schedule, title=title, cmap_name=cmap, xlim=makespan, ax=ax
         )
 
         if show_available_operations and available_operations is not None:
@@ -139,6 +155,21 @@ def plot_gantt_chart_wrapper(
     return plot_function
 
 
+def _get_cleared_axes(reused_axes: list[plt.Axes]) -> plt.Axes:
+    """Returns the reused axes after clearing them and their figure's texts.
+
+    The figure is not managed by pyplot, so closing it after saving a frame
+    does not prevent it from being drawn again.
+    """
+    if not reused_axes:
+        reused_axes.append(Figure().add_subplot())
+    ax = reused_axes[0]
+    ax.clear()
+    for text in list(ax.figure.texts):
+        text.remove()
+    return ax
+
+
 def create_gantt_chart_frames(
     frames_dir: str,
     instance: JobShopInstance,
@@ -164,25 +195,42 @@ def create_gantt_chart_frames(
         plot_current_time:
             Whether to plot a vertical line at the current time.
     """
+    for i, figure in enumerate(
+        _plot_gantt_chart_frames(
+            instance, solver, plot_function, plot_current_time
+        ),
+        start=1,
+    ):
+        _save_frame(figure, frames_dir, i)
+
+
+def _plot_gantt_chart_frames(
+    instance: JobShopInstance,
+    solver: DispatchingRuleSolver,
+    plot_function: Callable[
+        [Schedule, int, list[Operation] | None, int | None], Figure
+    ],
+    plot_current_time: bool,
+) -> Iterator[Figure]:
+    """Yields the Gantt chart of the schedule after each dispatch."""
     dispatcher = Dispatcher(instance, pruning_function=solver.pruning_function)
     history_tracker = HistoryTracker(dispatcher)
     makespan = solver.solve(instance, dispatcher).makespan()
     dispatcher.unsubscribe(history_tracker)
     dispatcher.reset()
-    for i, scheduled_operation in enumerate(history_tracker.history, start=1):
+    for scheduled_operation in history_tracker.history:
         dispatcher.dispatch(
             scheduled_operation.operation, scheduled_operation.machine_id
         )
         current_time = (
             None if not plot_current_time else dispatcher.current_time()
         )
-        fig = plot_function(
+        yield plot_function(
             dispatcher.schedule,
             makespan,
             dispatcher.available_operations(),
             current_time,
         )
-        _save_frame(fig, frames_dir, i)
 
 
 def _save_frame(figure: Figure, frames_dir: str, number: int) -> None:
@@ -190,6 +238,21 @@ def _save_frame(figure: Figure, frames_dir: str, number: int) -> None:
     plt.close(figure)
 
 
+def _figure_to_image(figure: Figure):
+    """Renders the figure as it would be saved as a frame and returns it as
+    an image array."""
+    buffer = io.BytesIO()
+    figure.savefig(
+        buffer,
+        format="png",
+        bbox_inches="tight",
+        pil_kwargs={"compress_level": 0},
+    )
+    plt.close(figure)
+    buffer.seek(0)
+    return imageio.imread(buffer)
+
+
 def create_gif_from_frames(frames_dir: str, gif_path: str, fps: int) -> None:
     """Creates a GIF from the frames in the given directory.
 
@@ -3,7 +3,6 @@
 import functools
 from typing import Optional, Callable
 import warnings
-import copy
 
 import matplotlib
 import matplotlib.pyplot as plt
@@ -70,16 +69,18 @@ def plot_disjunctive_graph(
             graphviz_layout, prog="dot", args="-Grankdir=LR"
         )
 
-    temp_graph = copy.deepcopy(job_shop_graph.graph)
-    # Remove disjunctive edges to get a better layout
-    temp_graph.remove_edges_from(
-        [
-            (u, v)
-            for u, v, d in job_shop_graph.graph.edges(data=True)
-            if d["type"] == EdgeType.DISJUNCTIVE
-        ]
+    # Split the edges by type in a single pass. Both lists are reused for
+    # the layout and for drawing.
+    conjunctive_edges, disjunctive_edges = _split_edges_by_type(
+        job_shop_graph
     )
 
+    # A shallow copy keeps the node and edge attributes available to custom
+    # layouts without copying the `Node` objects they reference.
+    # Disjunctive edges are removed to get a better layout.
+    temp_graph = job_shop_graph.graph.copy()
+    temp_graph.remove_edges_from(disjunctive_edges)
+
     try:
         pos = layout(temp_graph)
     except ImportError:
@@ -108,17 +109,6 @@ def plot_disjunctive_graph(
 
     # Draw edges
     # ----------
-    conjunctive_edges = [
-        (u, v)
-        for u, v, d in job_shop_graph.graph.edges(data=True)
-        if d["type"] == EdgeType.CONJUNCTIVE
-    ]
-    disjunctive_edges = [
-        (u, v)
-        for u, v, d in job_shop_graph.graph.edges(data=True)
-        if d["type"] == EdgeType.DISJUNCTIVE
-    ]
-
     nx.draw_networkx_edges(
         job_shop_graph.graph,
         pos,
@@ -208,3 +198,17 @@ def _get_node_color(node: Node) -> int:
         return node.operation.machine_id
 
     raise ValueError("Invalid node type.")
+
+
+def _split_edges_by_type(
+    job_shop_graph: JobShopGraph,
+) -> tuple[list[tuple[int, int]], list[tuple[int, int]]]:
+    """Returns the conjunctive and disjunctive edges of the graph."""
+    conjunctive_edges = []
+    disjunctive_edges = []
+    for u, v, edge_type in job_shop_graph.graph.edges(data="type"):
+        if edge_type == EdgeType.CONJUNCTIVE:
+            conjunctive_edges.append((u, v))
+        elif edge_type == EdgeType.DISJUNCTIVE:
+            disjunctive_edges.append((u, v))
+    return conjunctive_edges, disjunctive_edges
@@ -2,7 +2,7 @@
 
 from typing import Optional
 
-from matplotlib.figure import Figure
+from matplotlib.figure import Figure, SubFigure
 import matplotlib.pyplot as plt
 from matplotlib.colors import Normalize
 from matplotlib.patches import Patch
@@ -20,6 +20,7 @@ def plot_gantt_chart(
     cmap_name: str = "viridis",
     xlim: int | None = None,
     number_of_x_ticks: int = 15,
+    ax: plt.Axes | None = None,
 ) -> tuple[Figure, plt.Axes]:
     """Plots a Gantt chart for the schedule.
 
@@ -37,8 +38,11 @@ def plot_gantt_chart(
             the schedule is used.
         number_of_x_ticks:
             The number of ticks to use in the x-axis.
+        ax:
+            The axes to plot the Gantt chart on. If not provided, a new
+            figure is created.
     """
-    fig, ax = _initialize_plot(schedule, title)
+    fig, ax = _initialize_plot(schedule, title, ax)
     legend_handles = _plot_machine_schedules(schedule, ax, cmap_name)
     _configure_legend(ax, legend_handles)
     _configure_axes(schedule, ax, xlim, number_of_x_ticks)
@@ -46,20 +50,32 @@ def plot_gantt_chart(
 
 
 def _initialize_plot(
-    schedule: Schedule, title: str | None
+    schedule: Schedule, title: str | None, ax: plt.Axes | None = None
 ) -> tuple[Figure, plt.Axes]:
     """Initializes the plot."""
-    fig, ax = plt.subplots()
+    if ax is None:
+        fig, ax = plt.subplots()
+    else:
+        fig = _get_root_figure(ax)
     ax.set_xlabel("Time units")
     ax.set_ylabel("Machines")
     ax.grid(True, which="both", axis="x", linestyle="--", linewidth=0.5)
     ax.yaxis.grid(False)
     if title is None:
         title = f"Gantt Chart for {schedule.instance.name} instance"
-    plt.title(title)
+    ax.set_title(title)
     return fig, ax
 
 
+def _get_root_figure(ax: plt.Axes) -> Figure:
+    """Returns the figure that contains the axes, even if they are placed in
+    a subfigure."""
+    figure = ax.figure
+    while isinstance(figure, SubFigure):
+        figure = figure.figure
+    return figure
+
+
 def _plot_machine_schedules(
     schedule: Schedule, ax: plt.Axes, cmap_name: str
 ) -> dict[int, Patch]:
@@ -70,36 +86,42 @@ def _plot_machine_schedules(
     legend_handles = {}
 
     for machine_index, machine_schedule in enumerate(schedule.schedule):
+        if not machine_schedule:
+            continue
         y_position_for_machines = (
             _BASE_Y_POSITION + _Y_POSITION_INCREMENT * machine_index
         )
 
+        colors = []
         for scheduled_op in machine_schedule:
             color = cmap(norm(scheduled_op.job_id))
-            _plot_scheduled_operation(
-                ax, scheduled_op, y_position_for_machines, color
-            )
+            colors.append(color)
             if scheduled_op.job_id not in legend_handles:
                 legend_handles[scheduled_op.job_id] = Patch(
                     facecolor=color, label=f"Job {scheduled_op.job_id}"
                 )
+        _plot_machine_schedule(
+            ax, machine_schedule, y_position_for_machines, colors
+        )
 
     return legend_handles
 
 
-def _plot_scheduled_operation(
+def _plot_machine_schedule(
     ax: plt.Axes,
-    scheduled_op: ScheduledOperation,
+    machine_schedule: list[ScheduledOperation],
     y_position_for_machines: int,
-    color,
+    colors: list,
 ):
-    """Plots a single scheduled operation."""
-    start_time, end_time = scheduled_op.start_time, scheduled_op.end_time
-    duration = end_time - start_time
+    """Plots all the operations scheduled on a machine as a single collection
+    of bars, so the number of artists does not grow with the schedule."""
     ax.broken_barh(
-        [(start_time, duration)],
+        [
+            (scheduled_op.start_time, scheduled_op.operation.duration)
+            for scheduled_op in machine_schedule
+        ],
         (y_position_for_machines, 9),
-        facecolors=color,
+        facecolors=colors,
     )
 
 
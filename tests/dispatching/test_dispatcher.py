@@ -134,6 +134,19 @@ def test_cache(example_job_shop_instance: JobShopInstance):
     )
 
 
+def test_cached_results_are_not_modified(
+    example_job_shop_instance: JobShopInstance,
+):
+    dispatcher = Dispatcher(example_job_shop_instance)
+    job_1 = example_job_shop_instance.jobs[0]
+    dispatcher.dispatch(job_1[0], 0)
+    dispatcher.dispatch(job_1[1], 1)
+
+    num_unscheduled = len(dispatcher.unscheduled_operations())
+    assert len(dispatcher.uncompleted_operations()) > num_unscheduled
+    assert len(dispatcher.unscheduled_operations()) == num_unscheduled
+
+
 def test_current_time(example_job_shop_instance: JobShopInstance):
     dispatcher = Dispatcher(example_job_shop_instance)
     assignments = [
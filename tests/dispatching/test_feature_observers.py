@@ -1,7 +1,9 @@
 from job_shop_lib import JobShopInstance
+from job_shop_lib.benchmarking import load_benchmark_instance
 from job_shop_lib.dispatching.feature_observers import (
     feature_observer_factory,
     FeatureObserverType,
+    FeatureType,
     CompositeFeatureObserver,
 )
 
@@ -347,6 +349,67 @@ def test_duration_observer_init(irregular_job_shop_instance: JobShopInstance):
     )
 
 
+def test_is_completed_observer_matches_completed_operations():
+    instance = load_benchmark_instance("ft06")
+    dispatcher = Dispatcher(instance)
+    solver = DispatchingRuleSolver("most_work_remaining")
+    # Some operations are scheduled before the observer is created
+    for _ in range(5):
+        solver.step(dispatcher)
+    feature_observer = feature_observer_factory(
+        FeatureObserverType.IS_COMPLETED, dispatcher=dispatcher
+    )
+    while not dispatcher.schedule.is_complete():
+        solver.step(dispatcher)
+        completed_ids = {
+            operation.operation_id
+            for operation in dispatcher.completed_operations()
+        }
+        operation_features = feature_observer.features[
+            FeatureType.OPERATIONS
+        ]
+        for operation_id, is_completed in enumerate(operation_features[:, 0]):
+            assert bool(is_completed) == (operation_id in completed_ids)
+
+
+def _composite_operation_features_history(
+    reuse_buffers: bool, num_steps: int = 3
+):
+    dispatcher = Dispatcher(load_benchmark_instance("ft06"))
+    feature_observers = [
+        feature_observer_factory(observer_type, dispatcher=dispatcher)
+        for observer_type in (
+            FeatureObserverType.IS_READY,
+            FeatureObserverType.DURATION,
+            FeatureObserverType.IS_SCHEDULED,
+        )
+    ]
+    composite = CompositeFeatureObserver(
+        dispatcher, feature_observers, reuse_buffers=reuse_buffers
+    )
+    solver = DispatchingRuleSolver("most_work_remaining")
+    history = []
+    for _ in range(num_steps):
+        solver.step(dispatcher)
+        history.append(composite.features[FeatureType.OPERATIONS])
+    return history
+
+
+def test_composite_feature_observer_returns_new_arrays_by_default():
+    history = _composite_operation_features_history(reuse_buffers=False)
+
+    assert history[0] is not history[2]
+    assert not (history[0] == history[2]).all()
+
+
+def test_composite_feature_observer_reuse_buffers():
+    history = _composite_operation_features_history(reuse_buffers=False)
+    reused_history = _composite_operation_features_history(reuse_buffers=True)
+
+    assert reused_history[0] is reused_history[2]
+    assert (reused_history[2] == history[2]).all()
+
+
 if __name__ == "__main__":
     import pytest
 
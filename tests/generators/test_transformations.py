@@ -0,0 +1,75 @@
+import copy
+import random
+
+import pytest
+
+from job_shop_lib.benchmarking import load_benchmark_instance
+from job_shop_lib.generators import transformations
+from job_shop_lib.generation import (
+    transformations as generation_transformations,
+)
+
+
+def _machines_and_durations(jobs):
+    return [
+        [(operation.machines, operation.duration) for operation in job]
+        for job in jobs
+    ]
+
+
+def _expected_remaining_jobs(instance, min_jobs, max_jobs, seed):
+    """Removes jobs as `RemoveJobs` did with `copy.deepcopy`."""
+    random.seed(seed)
+    target_jobs = random.randint(min_jobs, max_jobs)
+    new_jobs = copy.deepcopy(instance.jobs)
+    while len(new_jobs) > target_jobs:
+        new_jobs.pop(random.randint(0, len(new_jobs) - 1))
+    return _machines_and_durations(new_jobs)
+
+
+@pytest.mark.parametrize(
+    "remove_jobs_class",
+    [transformations.RemoveJobs, generation_transformations.RemoveJobs],
+)
+def test_remove_jobs(remove_jobs_class):
+    instance = load_benchmark_instance("ta01")
+    original_jobs = _machines_and_durations(instance.jobs)
+    original_operations = [
+        operation for job in instance.jobs for operation in job
+    ]
+    expected_jobs = _expected_remaining_jobs(instance, 3, 8, seed=0)
+
+    random.seed(0)
+    new_instance = remove_jobs_class(min_jobs=3, max_jobs=8)(instance)
+
+    assert _machines_and_durations(new_instance.jobs) == expected_jobs
+    assert _machines_and_durations(instance.jobs) == original_jobs
+    assert len(instance.jobs) == len(original_jobs)
+    for job in new_instance.jobs:
+        for operation in job:
+            assert all(
+                operation is not original for original in original_operations
+            )
+            assert all(
+                operation.machines is not original.machines
+                for original in original_operations
+            )
+
+
+@pytest.mark.parametrize(
+    "remove_jobs_class",
+    [transformations.RemoveJobs, generation_transformations.RemoveJobs],
+)
+def test_remove_job(remove_jobs_class):
+    instance = load_benchmark_instance("ft06")
+    original_jobs = _machines_and_durations(instance.jobs)
+
+    new_instance = remove_jobs_class.remove_job(instance, 2)
+
+    assert _machines_and_durations(new_instance.jobs) == (
+        original_jobs[:2] + original_jobs[3:]
+    )
+    assert _machines_and_durations(instance.jobs) == original_jobs
+    assert new_instance.jobs[2][0] is not instance.jobs[3][0]
+    assert new_instance.jobs[2][0].job_id == 2
+    assert instance.jobs[3][0].job_id == 3
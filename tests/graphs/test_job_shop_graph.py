@@ -136,5 +136,26 @@ def test_remove_node(example_job_shop_instance):
         assert v in remaining_node_ids
 
 
+def test_remove_node_only_removes_isolated_neighbors(
+    example_job_shop_instance,
+):
+    graph = JobShopGraph(example_job_shop_instance)
+    add_conjunctive_edges(graph)
+    first_job = graph.nodes_by_job[0]
+    second_job = graph.nodes_by_job[1]
+
+    graph.remove_node(first_job[0].node_id)
+    assert graph.is_removed(first_job[0])
+    assert not graph.is_removed(first_job[1])
+
+    graph.remove_node(first_job[1].node_id)
+    # The last operation of the job has no edges left
+    assert graph.is_removed(first_job[2])
+    assert first_job[2].node_id not in graph.graph
+
+    # Nodes that are not neighbors of the removed ones are kept
+    assert all(not graph.is_removed(node) for node in second_job)
+
+
 if __name__ == "__main__":
     pytest.main(["-v", "tests/graphs/test_job_shop_graph.py"])
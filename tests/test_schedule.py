@@ -59,6 +59,59 @@ def test_schedule_is_complete_false(job_shop_instance: JobShopInstance):
     assert not schedule.is_complete()
 
 
+def test_num_scheduled_operations(complete_schedule: Schedule):
+    assert complete_schedule.num_scheduled_operations == 4
+
+    complete_schedule.reset()
+    assert complete_schedule.num_scheduled_operations == 0
+
+    schedule_copy = Schedule(
+        complete_schedule.instance, schedule=[[], [], []]
+    )
+    schedule_copy.schedule = [
+        [
+            ScheduledOperation(
+                complete_schedule.instance.jobs[0][0],
+                start_time=0,
+                machine_id=0,
+            )
+        ],
+        [],
+        [],
+    ]
+    assert schedule_copy.num_scheduled_operations == 1
+
+
+def test_in_place_edits_of_machine_schedules(complete_schedule: Schedule):
+    schedule = Schedule(complete_schedule.instance)
+    operation = complete_schedule.instance.jobs[0][0]
+    schedule.schedule[0].append(
+        ScheduledOperation(operation, start_time=3, machine_id=0)
+    )
+    assert schedule.num_scheduled_operations == 1
+    assert schedule.makespan() == 3 + operation.duration
+
+
+def test_makespan_after_setting_schedule(complete_schedule: Schedule):
+    expected_makespan = max(
+        machine_schedule[-1].end_time
+        for machine_schedule in complete_schedule.schedule
+        if machine_schedule
+    )
+    assert complete_schedule.makespan() == expected_makespan
+
+    complete_schedule.reset()
+    assert complete_schedule.makespan() == 0
+
+    operation = complete_schedule.instance.jobs[0][0]
+    complete_schedule.schedule = [
+        [ScheduledOperation(operation, start_time=3, machine_id=0)],
+        [],
+        [],
+    ]
+    assert complete_schedule.makespan() == 3 + operation.duration
+
+
 def test_check_start_time_raises_error(job_shop_instance: JobShopInstance):
     schedule = Schedule(instance=job_shop_instance)
     valid_op = ScheduledOperation(
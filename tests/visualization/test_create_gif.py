@@ -0,0 +1,17 @@
+from job_shop_lib.dispatching import DispatchingRuleSolver
+from job_shop_lib.visualization import plot_gantt_chart_wrapper
+
+
+def test_plot_gantt_chart_wrapper_reuses_figure(example_job_shop_instance):
+    schedule = DispatchingRuleSolver().solve(example_job_shop_instance)
+    plot_function = plot_gantt_chart_wrapper(
+        show_available_operations=True, reuse_figure=True
+    )
+
+    first_figure = plot_function(schedule, 20, [], 5)
+    second_figure = plot_function(schedule, 20, [], 5)
+
+    assert first_figure is second_figure
+    assert len(second_figure.axes) == 1
+    assert len(second_figure.texts) == 1
+    assert len(second_figure.axes[0].lines) == 1
@@ -0,0 +1,19 @@
+import matplotlib.pyplot as plt
+
+from job_shop_lib.dispatching import DispatchingRuleSolver
+from job_shop_lib.visualization import plot_gantt_chart
+
+
+def test_plot_gantt_chart_on_subfigure_axes(example_job_shop_instance):
+    schedule = DispatchingRuleSolver().solve(example_job_shop_instance)
+    root_figure = plt.figure()
+    subfigure = root_figure.subfigures(1, 2)[0]
+    nested_subfigure = subfigure.subfigures(2, 1)[1]
+
+    for axes in (subfigure.add_subplot(), nested_subfigure.add_subplot()):
+        fig, ax = plot_gantt_chart(schedule, ax=axes)
+        assert fig is root_figure
+        assert ax is axes
+        assert len(ax.collections) > 0
+
+    plt.close(root_figure)
@@ -1,7 +1,8 @@
+import networkx as nx
 import pytest
 
 from job_shop_lib.visualization import plot_disjunctive_graph
-from job_shop_lib.graphs import build_disjunctive_graph
+from job_shop_lib.graphs import build_disjunctive_graph, EdgeType
 
 
 @pytest.mark.mpl_image_compare(
@@ -12,3 +13,24 @@ def test_plot_disjunctive_graph(example_job_shop_instance):
     fig = plot_disjunctive_graph(graph)
 
     return fig
+
+
+def test_plot_disjunctive_graph_layout_receives_attributes(
+    example_job_shop_instance,
+):
+    graph = build_disjunctive_graph(example_job_shop_instance)
+    num_edges = graph.graph.number_of_edges()
+    received = {}
+
+    def layout(layout_graph):
+        received["nodes"] = dict(layout_graph.nodes(data="node"))
+        received["edge_types"] = set(
+            edge_type for *_, edge_type in layout_graph.edges(data="type")
+        )
+        return nx.spring_layout(layout_graph, seed=0)
+
+    plot_disjunctive_graph(graph, layout=layout)
+
+    assert received["nodes"] == dict(graph.graph.nodes(data="node"))
+    assert received["edge_types"] == {EdgeType.CONJUNCTIVE}
+    assert graph.graph.number_of_edges() == num_edges